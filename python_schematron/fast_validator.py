@@ -4,23 +4,224 @@ Uses the local XSLT transformer to generate validation rules dynamically.
 Optimized for large XML files with thousands of line items.
 """
 
+import atexit
+import io
+import os
 import sys
 import time
 import argparse
+import hashlib
 import json
+import logging
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 import xml.etree.ElementTree as ET
 
 try:
-    from saxonche import PySaxonProcessor
+    from saxonche import PySaxonProcessor, PySaxonApiError
 except ImportError:
     print("Error: SaxonC-HE not found. Please install it with: pip install saxonche")
     sys.exit(1)
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None  # Fall back to xml.etree's iterparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json encoder
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ErrorDetail:
+    """One failed assertion; fixed-layout record instead of a per-error dict."""
+    location: str
+    test: str
+    message: str
+    severity: str
+    role: str
+    rule_id: Optional[str] = None
+
+    def to_json_dict(self) -> Dict[str, str]:
+        """JSON shape of the record; rule_id is omitted when not present."""
+        detail = {
+            'location': self.location,
+            'test': self.test,
+            'message': self.message,
+            'severity': self.severity,
+            'role': self.role
+        }
+        if self.rule_id is not None:
+            detail['rule_id'] = self.rule_id
+        return detail
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler without logging's per-record flush.
+
+    Progress output goes through a buffered stream and is flushed at
+    shutdown; warnings and errors still flush immediately so problems
+    surface right away even mid-run.
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+def configure_logging(quiet: bool = False) -> None:
+    """Configure buffered stdout logging for the CLI (idempotent)."""
+    root = logging.getLogger()
+    if root.handlers:
+        return
+    stream = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8',
+                              errors='replace', write_through=False)
+    handler = BufferedStreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    root.addHandler(handler)
+    root.setLevel(logging.WARNING if quiet else logging.INFO)
+
+
+def flush_logging() -> None:
+    """Flush buffered log output.
+
+    Must be called before handing fd 1 to code that writes with plain
+    print (e.g. the Schematron transformer), otherwise its unbuffered
+    output lands on the terminal ahead of earlier buffered log lines.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+
+# Qualified SVRL tag names used by the streaming analyzer
+SVRL_NS = 'http://purl.oclc.org/dsdl/svrl'
+FIRED_RULE_TAG = f'{{{SVRL_NS}}}fired-rule'
+FAILED_ASSERT_TAG = f'{{{SVRL_NS}}}failed-assert'
+SUCCESSFUL_REPORT_TAG = f'{{{SVRL_NS}}}successful-report'
+TEXT_TAG = f'{{{SVRL_NS}}}text'
+RULE_TAG = f'{{{SVRL_NS}}}rule'
+
+# Common spellings of the standard Schematron roles, mapped straight to their
+# canonical severity so the frequent role-is-set case needs no lowercasing
+DIRECT_ROLES = {
+    spelling: canonical
+    for canonical in ('fatal', 'error', 'warning', 'info')
+    for spelling in (canonical, canonical.upper(), canonical.capitalize())
+}
+
+# Severity keyword matchers, compiled once; IGNORECASE avoids allocating a
+# lowercased copy of every assertion message
+SEVERITY_FATAL_RE = re.compile(r'fatal|critical|must not|required', re.IGNORECASE)
+SEVERITY_ERROR_RE = re.compile(r'error|invalid|violation|shall not', re.IGNORECASE)
+SEVERITY_WARNING_RE = re.compile(r'warning|should|recommend', re.IGNORECASE)
+SEVERITY_INFO_RE = re.compile(r'info|information|note', re.IGNORECASE)
+
+# Counter attributes of the compact <summary> element, extracted without an
+# XML parse on the no-failure fast path
+SUMMARY_FIRED_RE = re.compile(r'fired="(\d+)"')
+SUMMARY_FAILED_RE = re.compile(r'failed="(\d+)"')
+SUMMARY_REPORTS_RE = re.compile(r'reports="(\d+)"')
+
+# Driver stylesheet that imports a generated Schematron XSLT and reduces its
+# SVRL output inside Saxon to a compact summary (counters as attributes, one
+# <failure> element per failed assert), so Python never has to serialize and
+# re-parse the full multi-MB SVRL document just to count elements.
+SVRL_SUMMARY_DRIVER = """<?xml version="1.0" encoding="UTF-8"?>
+<xsl:stylesheet version="3.0"
+                xmlns:xsl="http://www.w3.org/1999/XSL/Transform"
+                xmlns:svrl="http://purl.oclc.org/dsdl/svrl"
+                exclude-result-prefixes="svrl">
+  <!-- schematron xslt hash: %(source_hash)s -->
+  <xsl:import href="%(href)s"/>
+  <xsl:output method="xml" indent="no"/>
+  <xsl:template match="/">
+    <xsl:variable name="svrl-output">
+      <xsl:apply-imports/>
+    </xsl:variable>
+    <summary fired="{count($svrl-output//svrl:fired-rule)}"
+             failed="{count($svrl-output//svrl:failed-assert)}"
+             reports="{count($svrl-output//svrl:successful-report)}">
+      <xsl:for-each select="$svrl-output//svrl:failed-assert">
+        <failure>
+          <xsl:copy-of select="@location | @test | @role | @id"/>
+          <text><xsl:value-of select="svrl:text"/></text>
+        </failure>
+      </xsl:for-each>
+    </summary>
+  </xsl:template>
+</xsl:stylesheet>
+"""
+
 # Import our local transformer
 from schematron_to_xslt_local import SchematronToXSLTTransformer
 
+# Per-process validator for the sample-file process pool; created lazily so
+# each worker process gets its own PySaxonProcessor
+_WORKER_VALIDATOR: Optional['FastSchematronValidator'] = None
+
+# Set after the first failed SEF export: Saxon-HE cannot save compiled
+# stylesheets, so the failure is permanent for the process and further
+# compiles skip the save= attempt entirely
+_SEF_EXPORT_UNAVAILABLE = False
+
+
+def _note_sef_export_failure(error: Exception) -> None:
+    """Record a failed SEF export; warn the first time, then go quiet."""
+    global _SEF_EXPORT_UNAVAILABLE
+    if not _SEF_EXPORT_UNAVAILABLE:
+        _SEF_EXPORT_UNAVAILABLE = True
+        logger.warning("⚠️ Warning: Could not export compiled XSLT "
+                       f"(compiling from source for the rest of this run): {error}")
+
+
+def _worker_cleanup() -> None:
+    """Release the worker's Saxon state and flush logging before exit.
+
+    Leaving the validator in the module global until interpreter shutdown
+    makes Saxon teardown run after stdio has been torn down, which raises
+    inside sys.excepthook on every worker exit; dropping it from an atexit
+    hook (and flushing the buffered log handler) keeps worker exit clean.
+    """
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = None
+    flush_logging()
+
+
+def _validate_one(xml_path: str, xsl_paths: List[str],
+                  file_size: Optional[int] = None,
+                  quiet: bool = False) -> Dict[str, Any]:
+    """Validate a single XML file in a worker process."""
+    global _WORKER_VALIDATOR
+    if _WORKER_VALIDATOR is None:
+        configure_logging(quiet)  # Spawned workers start without handlers
+        _WORKER_VALIDATOR = FastSchematronValidator()
+        atexit.register(_worker_cleanup)
+
+    stats_before = dict(_WORKER_VALIDATOR.stats)
+    result = _WORKER_VALIDATOR.validate_xml_file(Path(xml_path), [Path(p) for p in xsl_paths],
+                                                 file_size=file_size)
+    # Ship this call's stats delta back with the result; the counters live
+    # in the worker's validator and would otherwise never reach the parent
+    result['_stats_delta'] = {
+        key: _WORKER_VALIDATOR.stats[key] - stats_before[key]
+        for key in ('total_validations', 'cache_hits', 'total_time')
+    }
+    result['_stats_delta']['largest_file_size'] = _WORKER_VALIDATOR.stats['largest_file_size']
+    return result
+
 
 class FastSchematronValidator:
     """High-performance Schematron validator using dynamically generated XSLT."""
@@ -33,15 +234,29 @@ class FastSchematronValidator:
         
         # Results directory for JSON outputs
         self.results_dir = Path(__file__).parent / "results"
+
+        # Persistent cache for exported (SEF) compiled stylesheets
+        self.sef_dir = self.results_dir.parent / ".xslt_cache"
         try:
             self.results_dir.mkdir(exist_ok=True)
+            self.sef_dir.mkdir(exist_ok=True)
         except (OSError, PermissionError) as e:
-            print(f"Error: Could not create results directory: {e}")
+            logger.warning(f"Error: Could not create results directory: {e}")
             raise
-        
-        # Cache for compiled XSLT executables
-        self.xslt_cache: Dict[str, Any] = {}
-        
+
+        # Saxon processors are not thread-safe, so each worker thread gets its
+        # own processor, XSLT compiler and compiled-executable cache
+        self._thread_local = threading.local()
+        self._thread_local.processor = self.processor
+        self._thread_local.xslt_processor = self.xslt_processor
+        self._thread_local.xslt_cache = {}
+        self._stats_lock = threading.Lock()
+
+        # Source hashes of the generated XSLTs, memoized per path so the
+        # summary driver and SEF cache key don't re-read and re-hash the
+        # same multi-MB stylesheet on every validation call
+        self._source_hashes: Dict[str, Tuple[int, int, str]] = {}
+
         # Statistics
         self.stats = {
             'total_validations': 0,
@@ -52,68 +267,170 @@ class FastSchematronValidator:
     
     def ensure_xslt_generated(self, force_rebuild: bool = False) -> bool:
         """Ensure XSLT files are generated from Schematron files."""
-        print("🔄 Checking/generating XSLT files from Schematron...")
-        
+        logger.info("🔄 Checking/generating XSLT files from Schematron...")
+
+        # The transformer reports through plain print; flush our buffered
+        # log lines first so the output stays in chronological order
+        flush_logging()
+
         start_time = time.time()
         success = self.transformer.transform_all_schematron_files(force_rebuild)
         generation_time = time.time() - start_time
         
         if success:
-            print(f"✅ XSLT generation completed in {generation_time:.2f} seconds")
+            logger.info(f"✅ XSLT generation completed in {generation_time:.2f} seconds")
             return True
         else:
-            print("❌ XSLT generation failed")
+            logger.warning("❌ XSLT generation failed")
             return False
     
+    def _get_thread_saxon(self) -> Any:
+        """Get (lazily creating) the Saxon state owned by the calling thread."""
+        thread_state = self._thread_local
+        if getattr(thread_state, 'processor', None) is None:
+            thread_state.processor = PySaxonProcessor(license=False)
+            thread_state.xslt_processor = thread_state.processor.new_xslt30_processor()
+            thread_state.xslt_cache = {}
+        return thread_state
+
+    def _get_source_hash(self, xsl_file: Path) -> str:
+        """Content hash of a generated XSLT, memoized against mtime and size.
+
+        The hash keys both the summary driver and the SEF cache, and both
+        are consulted for every (XML file x stylesheet) pair — without
+        memoization each validation re-reads and re-hashes the same
+        multi-MB stylesheet twice. A regenerated file changes its stat and
+        is re-hashed.
+        """
+        path_key = str(xsl_file)
+        stat = xsl_file.stat()
+        cached = self._source_hashes.get(path_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        source_hash = hashlib.sha256(xsl_file.read_bytes()).hexdigest()[:16]
+        self._source_hashes[path_key] = (stat.st_mtime_ns, stat.st_size, source_hash)
+        return source_hash
+
+    def _get_summary_driver(self, xsl_file: Path) -> Optional[Path]:
+        """Get (writing once) the compact-summary driver for a generated XSLT.
+
+        The driver file name embeds a hash of the generated stylesheet, so a
+        regenerated XSLT automatically gets a fresh driver and SEF entry.
+        """
+        try:
+            source_hash = self._get_source_hash(xsl_file)
+            driver_path = self.sef_dir / f"{xsl_file.stem}-{source_hash}.driver.xsl"
+            if not driver_path.exists():
+                driver_path.write_text(SVRL_SUMMARY_DRIVER % {
+                    'href': xsl_file.resolve().as_uri(),
+                    'source_hash': source_hash
+                }, encoding='utf-8')
+            return driver_path
+        except Exception as e:
+            logger.warning(f"⚠️ Warning: Could not create summary driver for {xsl_file.name}: {e}")
+            return None
+
     def get_compiled_xslt(self, xsl_file: Path) -> Optional[Any]:
         """Get compiled XSLT executable, using cache when possible."""
+        thread_state = self._get_thread_saxon()
         cache_key = str(xsl_file)
-        
-        if cache_key in self.xslt_cache:
-            self.stats['cache_hits'] += 1
-            return self.xslt_cache[cache_key]
+
+        if cache_key in thread_state.xslt_cache:
+            with self._stats_lock:
+                self.stats['cache_hits'] += 1
+            return thread_state.xslt_cache[cache_key]
         
         if not xsl_file.exists():
-            print(f"❌ XSLT file not found: {xsl_file}")
+            logger.warning(f"❌ XSLT file not found: {xsl_file}")
             return None
-        
+
         try:
-            print(f"📋 Compiling XSLT: {xsl_file.name}")
-            xslt_executable = self.xslt_processor.compile_stylesheet(stylesheet_file=str(xsl_file))
-            
+            # Check the persistent SEF cache (keyed by source content hash) so
+            # repeated CLI runs don't pay the full compile cost again
+            source_hash = self._get_source_hash(xsl_file)
+            sef_path = self.sef_dir / f"{xsl_file.stem}-{source_hash}.sef.json"
+
+            xslt_executable = self._compile_from_sef(thread_state, sef_path)
+            if xslt_executable is not None:
+                logger.info(f"📋 Loaded compiled XSLT from cache: {sef_path.name}")
+            else:
+                logger.info(f"📋 Compiling XSLT: {xsl_file.name}")
+                if not _SEF_EXPORT_UNAVAILABLE:
+                    # Export the compiled form (SEF) for future runs, then
+                    # load it. Saxon-HE raises on save= but still creates the
+                    # output file, so the export goes to a temp path that is
+                    # moved into place only when it has content — a failed
+                    # export never leaves a partial SEF for later runs (or
+                    # other threads) to trip over.
+                    tmp_sef_path = sef_path.with_name(
+                        f"{sef_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+                    try:
+                        thread_state.xslt_processor.compile_stylesheet(
+                            stylesheet_file=str(xsl_file), save=True,
+                            output_file=str(tmp_sef_path))
+                        if tmp_sef_path.exists() and tmp_sef_path.stat().st_size > 0:
+                            os.replace(tmp_sef_path, sef_path)
+                    except Exception as e:
+                        _note_sef_export_failure(e)
+                    finally:
+                        tmp_sef_path.unlink(missing_ok=True)
+
+                    xslt_executable = self._compile_from_sef(thread_state, sef_path)
+
+                if xslt_executable is None:
+                    # No usable SEF (e.g. Saxon-HE cannot export) - plain compile
+                    xslt_executable = thread_state.xslt_processor.compile_stylesheet(
+                        stylesheet_file=str(xsl_file))
+
             if not xslt_executable:
-                print(f"❌ Failed to compile XSLT: {xsl_file}")
-                print(f"Saxon error: {self.processor.error_message}")
+                logger.warning(f"❌ Failed to compile XSLT: {xsl_file}")
+                logger.info(f"Saxon error: {thread_state.processor.error_message}")
                 return None
-            
+
             # Cache the compiled executable
-            self.xslt_cache[cache_key] = xslt_executable
+            thread_state.xslt_cache[cache_key] = xslt_executable
             return xslt_executable
-            
+
         except Exception as e:
-            print(f"❌ Error compiling XSLT {xsl_file}: {e}")
+            logger.warning(f"❌ Error compiling XSLT {xsl_file}: {e}")
             return None
-    
-    def validate_xml_file(self, xml_file: Path, xsl_files: List[Path]) -> Dict[str, Any]:
+
+    @staticmethod
+    def _compile_from_sef(thread_state: Any, sef_path: Path) -> Optional[Any]:
+        """Load a cached SEF export, treating empty or unloadable files as a miss."""
+        try:
+            if not sef_path.exists() or sef_path.stat().st_size == 0:
+                return None
+            return thread_state.xslt_processor.compile_stylesheet(
+                stylesheet_file=str(sef_path)) or None
+        except Exception:
+            return None
+
+    def validate_xml_file(self, xml_file: Path, xsl_files: List[Path],
+                          file_size: Optional[int] = None) -> Dict[str, Any]:
         """
         Validate an XML file against multiple XSLT files.
-        
+
         Args:
             xml_file: Path to the XML file to validate
             xsl_files: List of XSLT files to validate against
-            
+            file_size: Size of the XML file if the caller already stat'ed it
+
         Returns:
             Dictionary with validation results
         """
-        if not xml_file.exists():
-            return {'success': False, 'error': f'XML file not found: {xml_file}'}
-        
-        # Get file size for statistics
-        file_size = xml_file.stat().st_size
+        # One stat covers both the existence check and the size lookup, and is
+        # skipped entirely when the caller passes the size from its dir scan
+        if file_size is None:
+            try:
+                file_size = xml_file.stat().st_size
+            except OSError:
+                return {'success': False, 'error': f'XML file not found: {xml_file}'}
         self.stats['largest_file_size'] = max(self.stats['largest_file_size'], file_size)
         
-        print(f"\n🔍 Validating: {xml_file.name}")
-        print(f"📊 File size: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
+        logger.info(f"\n🔍 Validating: {xml_file.name}")
+        logger.info(f"📊 File size: {file_size:,} bytes ({file_size/1024/1024:.1f} MB)")
         
         validation_start = time.time()
         results = {
@@ -127,21 +444,34 @@ class FastSchematronValidator:
             'total_successful_reports': 0
         }
         
-        for xsl_file in xsl_files:
-            if not xsl_file.exists():
-                result = {
-                    'xslt_file': str(xsl_file),
-                    'success': False,
-                    'error': f'XSLT file not found: {xsl_file}'
+        # Read the XML once; each worker thread parses this in-memory buffer
+        # with its own Saxon processor instead of re-reading the file from disk
+        try:
+            xml_text = xml_file.read_text(encoding='utf-8')
+        except UnicodeDecodeError:
+            # Non-UTF-8 document: let each thread parse directly from the file
+            xml_text = None
+        except OSError as e:
+            return {'success': False, 'error': f'Failed to read XML file {xml_file}: {e}'}
+
+        # Each stylesheet is an independent CPU-bound transform (SaxonC releases
+        # the GIL in native code), so run them in parallel worker threads.
+        # Missing stylesheets are caught once inside get_compiled_xslt on the
+        # cache-miss path instead of an extra exists() stat per (file, XSLT).
+        xslt_results: List[Optional[Dict[str, Any]]] = [None] * len(xsl_files)
+        if xsl_files:
+            max_workers = min(len(xsl_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._validate_against_xslt, xml_text, xml_file, xsl_file): index
+                    for index, xsl_file in enumerate(xsl_files)
                 }
-                results['xslt_results'].append(result)
-                results['success'] = False
-                continue
-            
-            # Validate against this XSLT
-            result = self._validate_against_xslt(xml_file, xsl_file)
+                for future, index in futures.items():
+                    xslt_results[index] = future.result()
+
+        for result in xslt_results:
             results['xslt_results'].append(result)
-            
+
             if result['success']:
                 results['total_fired_rules'] += result.get('fired_rules', 0)
                 results['total_failed_assertions'] += result.get('failed_assertions', 0)
@@ -160,23 +490,28 @@ class FastSchematronValidator:
         
         # Print summary
         if results['success']:
-            print(f"✅ Validation completed in {validation_time:.3f} seconds")
-            print(f"📊 Total fired rules: {results['total_fired_rules']}")
-            print(f"📊 Failed assertions: {results['total_failed_assertions']}")
-            print(f"📊 Successful reports: {results['total_successful_reports']}")
+            logger.info(f"✅ Validation completed in {validation_time:.3f} seconds")
+            logger.info(f"📊 Total fired rules: {results['total_fired_rules']}")
+            logger.info(f"📊 Failed assertions: {results['total_failed_assertions']}")
+            logger.info(f"📊 Successful reports: {results['total_successful_reports']}")
             
             if results['total_failed_assertions'] == 0:
-                print("🎉 XML is VALID - no validation errors found!")
+                logger.info("🎉 XML is VALID - no validation errors found!")
             else:
-                print(f"⚠️  XML has {results['total_failed_assertions']} validation errors")
+                logger.warning(f"⚠️  XML has {results['total_failed_assertions']} validation errors")
         else:
-            print(f"❌ Validation failed in {validation_time:.3f} seconds")
+            logger.warning(f"❌ Validation failed in {validation_time:.3f} seconds")
         
         return results
     
-    def _validate_against_xslt(self, xml_file: Path, xsl_file: Path) -> Dict[str, Any]:
-        """Validate XML file against a single XSLT file."""
-        print(f"  🔄 Running {xsl_file.name}...")
+    def _validate_against_xslt(self, xml_text: Optional[str], xml_file: Path,
+                               xsl_file: Path) -> Dict[str, Any]:
+        """Validate an XML document against a single XSLT file.
+
+        Runs on a worker thread: parses the shared in-memory XML buffer (or the
+        file, for non-UTF-8 documents) with the thread's own Saxon processor.
+        """
+        logger.info(f"  🔄 Running {xsl_file.name}...")
         
         start_time = time.time()
         result = {
@@ -190,221 +525,409 @@ class FastSchematronValidator:
         }
         
         try:
+            thread_state = self._get_thread_saxon()
+
+            # Prefer the summary driver so Saxon aggregates the SVRL itself;
+            # fall back to the raw stylesheet (full SVRL output) if needed
+            driver_file = self._get_summary_driver(xsl_file)
+
             # Get compiled XSLT
-            xslt_executable = self.get_compiled_xslt(xsl_file)
+            xslt_executable = self.get_compiled_xslt(driver_file if driver_file else xsl_file)
             if not xslt_executable:
                 result['error'] = 'Failed to compile XSLT'
                 return result
-            
-            # Execute transformation
-            svrl_output = xslt_executable.transform_to_string(source_file=str(xml_file))
-            
-            if self.processor.exception_occurred:
-                result['error'] = f"XSLT transformation failed: {self.processor.error_message}"
-                return result
-            
-            # Parse SVRL output
+
+            # Parse the source with this thread's processor and transform
+            if xml_text is not None:
+                xdm_source = thread_state.processor.parse_xml(xml_text=xml_text)
+            else:
+                xdm_source = thread_state.processor.parse_xml(xml_file_name=str(xml_file))
+
+            # Keep the result as an XdmValue and read the summary counters
+            # straight off the tree — no serialize + re-parse round trip.
+            # Serialization remains as fallback (and for full-SVRL output).
+            svrl_output = ''
+            analyzed = False
+            try:
+                xdm_result = xslt_executable.transform_to_value(xdm_node=xdm_source)
+                if xdm_result is not None:
+                    analyzed = self._analyze_xdm_summary(xdm_result, result)
+            except Exception:
+                analyzed = False
+
+            if not analyzed:
+                # SaxonC raises PySaxonApiError on failure, so no extra
+                # Python->C exception_occurred query is needed afterwards
+                svrl_output = xslt_executable.transform_to_string(xdm_node=xdm_source)
+
             result['svrl_output'] = svrl_output
             result['success'] = True
             result['time'] = time.time() - start_time
+
+            # Analyze serialized output only when the tree-native path didn't run
+            if not analyzed:
+                self._analyze_svrl_output(svrl_output, result)
             
-            # Analyze SVRL results
-            self._analyze_svrl_output(svrl_output, result)
-            
-            print(f"    ✅ Completed in {result['time']:.3f}s - Rules: {result['fired_rules']}, "
+            logger.info(f"    ✅ Completed in {result['time']:.3f}s - Rules: {result['fired_rules']}, "
                   f"Errors: {result['failed_assertions']}, Reports: {result['successful_reports']}")
             
+        except PySaxonApiError as e:
+            result['error'] = f"XSLT transformation failed: {e}"
+            result['time'] = time.time() - start_time
+            logger.warning(f"    ❌ Failed in {result['time']:.3f}s: {e}")
         except Exception as e:
             result['error'] = str(e)
             result['time'] = time.time() - start_time
-            print(f"    ❌ Failed in {result['time']:.3f}s: {e}")
+            logger.warning(f"    ❌ Failed in {result['time']:.3f}s: {e}")
         
         return result
     
+    def _analyze_xdm_summary(self, xdm_value: Any, result: Dict[str, Any]) -> bool:
+        """Read the compact <summary> counters directly from a Saxon result tree.
+
+        Returns True when the value carried a usable summary; False tells the
+        caller to fall back to the serialized-output analyzer.
+        """
+        try:
+            node = getattr(xdm_value, 'head', None) or xdm_value
+
+            summary = None
+            if getattr(node, 'name', None) == 'summary':
+                summary = node
+            else:
+                for child in getattr(node, 'children', None) or []:
+                    if getattr(child, 'name', None) == 'summary':
+                        summary = child
+                        break
+            if summary is None:
+                return False
+
+            fired = summary.get_attribute_value('fired')
+            failed = summary.get_attribute_value('failed')
+            reports = summary.get_attribute_value('reports')
+            if fired is None or failed is None or reports is None:
+                return False
+
+            result['fired_rules'] = int(fired)
+            result['failed_assertions'] = int(failed)
+            result['successful_reports'] = int(reports)
+            result['severity_breakdown'] = severity_breakdown = {
+                'fatal': 0,
+                'error': 0,
+                'warning': 0,
+                'info': 0
+            }
+
+            if result['failed_assertions'] == 0:
+                return True
+
+            error_details: List[ErrorDetail] = []
+            for failure in summary.children or []:
+                if getattr(failure, 'name', None) != 'failure':
+                    continue
+
+                location = failure.get_attribute_value('location') or 'Unknown'
+                test = failure.get_attribute_value('test') or 'Unknown'
+                role = failure.get_attribute_value('role') or 'error'
+                rule_id = failure.get_attribute_value('id')
+
+                message = 'No message'
+                for child in failure.children or []:
+                    if getattr(child, 'name', None) == 'text':
+                        message = child.string_value or 'No message'
+                        break
+
+                severity = self._determine_severity(role, message, test)
+                if severity in severity_breakdown:
+                    severity_breakdown[severity] += 1
+                else:
+                    severity_breakdown['error'] += 1  # Default fallback
+
+                error_details.append(ErrorDetail(location, test, message, severity, role, rule_id))
+
+            if error_details:
+                result['error_details'] = error_details
+
+            return True
+
+        except Exception:
+            return False
+
+    def _analyze_summary_output(self, summary_output: str, result: Dict[str, Any]):
+        """Analyze the compact <summary> document emitted by the driver stylesheet."""
+        root = ET.fromstring(summary_output)
+
+        result['fired_rules'] = int(root.get('fired', '0'))
+        result['failed_assertions'] = int(root.get('failed', '0'))
+        result['successful_reports'] = int(root.get('reports', '0'))
+        result['severity_breakdown'] = severity_breakdown = {
+            'fatal': 0,
+            'error': 0,
+            'warning': 0,
+            'info': 0
+        }
+
+        error_details: List[ErrorDetail] = []
+        for failure in root:
+            # One attrib-dict fetch per failure instead of four .get() calls
+            # routed through the element wrapper
+            attrs = failure.attrib
+            location = attrs.get('location', 'Unknown')
+            test = attrs.get('test', 'Unknown')
+            role = attrs.get('role', 'error')  # Default to 'error' if no role specified
+            rule_id = attrs.get('id')
+
+            message = 'No message'
+            for child in failure:
+                if child.tag == 'text':
+                    message = child.text or 'No message'
+                    break
+
+            severity = self._determine_severity(role, message, test)
+            if severity in severity_breakdown:
+                severity_breakdown[severity] += 1
+            else:
+                severity_breakdown['error'] += 1  # Default fallback
+
+            error_details.append(ErrorDetail(location, test, message, severity, role, rule_id))
+
+        if error_details:
+            result['error_details'] = error_details
+
     def _analyze_svrl_output(self, svrl_output: str, result: Dict[str, Any]):
-        """Analyze SVRL output to extract validation statistics and detailed error information."""
+        """Analyze validation output to extract statistics and detailed error information.
+
+        Handles the compact <summary> format produced by the driver stylesheet
+        (the normal case) and falls back to streaming full SVRL with iterparse
+        (lxml when available) in one forward pass without holding the full
+        document tree in memory.
+        """
         try:
-            # Parse SVRL XML
-            root = ET.fromstring(svrl_output)
-            
-            # Count different types of results
-            # Define namespace for SVRL
-            ns = {'svrl': 'http://purl.oclc.org/dsdl/svrl'}
-            
-            # Count fired rules
-            fired_rules = root.findall('.//svrl:fired-rule', ns)
-            result['fired_rules'] = len(fired_rules)
-            
-            # Count failed assertions
-            failed_assertions = root.findall('.//svrl:failed-assert', ns)
-            result['failed_assertions'] = len(failed_assertions)
-            
-            # Count successful reports
-            successful_reports = root.findall('.//svrl:successful-report', ns)
-            result['successful_reports'] = len(successful_reports)
-            
+            # Fast path: no failures means only counters are needed, and those
+            # can be pulled with C-level string scans instead of an XML parse
+            empty_breakdown = {'fatal': 0, 'error': 0, 'warning': 0, 'info': 0}
+
+            if '<summary' in svrl_output[:512]:
+                if '<failure' not in svrl_output:
+                    fired = SUMMARY_FIRED_RE.search(svrl_output)
+                    failed = SUMMARY_FAILED_RE.search(svrl_output)
+                    reports = SUMMARY_REPORTS_RE.search(svrl_output)
+                    if fired and failed and reports:
+                        result['fired_rules'] = int(fired.group(1))
+                        result['failed_assertions'] = int(failed.group(1))
+                        result['successful_reports'] = int(reports.group(1))
+                        result['severity_breakdown'] = empty_breakdown
+                        return
+                self._analyze_summary_output(svrl_output, result)
+                return
+
+            if 'failed-assert' not in svrl_output:
+                result['fired_rules'] = svrl_output.count('<svrl:fired-rule')
+                result['failed_assertions'] = 0
+                result['successful_reports'] = svrl_output.count('<svrl:successful-report')
+                result['severity_breakdown'] = empty_breakdown
+                return
+
+            source = io.BytesIO(svrl_output.encode('utf-8'))
+
+            fired_rules = 0
+            failed_assertions = 0
+            successful_reports = 0
+            error_details: List[ErrorDetail] = []
+
             # Initialize severity counters
-            result['severity_breakdown'] = {
+            severity_breakdown = {
                 'fatal': 0,
                 'error': 0,
                 'warning': 0,
                 'info': 0
             }
-            
-            # Extract detailed error information
-            if failed_assertions:
-                result['error_details'] = []
-                for assertion in failed_assertions:
-                    location = assertion.get('location', 'Unknown')
-                    test = assertion.get('test', 'Unknown')
-                    role = assertion.get('role', 'error')  # Default to 'error' if no role specified
-                    
-                    text_elem = assertion.find('svrl:text', ns)
-                    message = text_elem.text if text_elem is not None else 'No message'
-                    
+
+            if lxml_etree is not None:
+                events = lxml_etree.iterparse(source, events=('end',))
+            else:
+                events = ET.iterparse(source, events=('end',))
+
+            for _event, elem in events:
+                tag = elem.tag
+
+                if tag == FIRED_RULE_TAG:
+                    fired_rules += 1
+
+                elif tag == SUCCESSFUL_REPORT_TAG:
+                    successful_reports += 1
+
+                elif tag == FAILED_ASSERT_TAG:
+                    failed_assertions += 1
+
+                    attrs = elem.attrib
+                    location = attrs.get('location', 'Unknown')
+                    test = attrs.get('test', 'Unknown')
+                    role = attrs.get('role', 'error')  # Default to 'error' if no role specified
+
+                    message = 'No message'
+                    rule_id = None
+                    for child in elem:
+                        if child.tag == TEXT_TAG:
+                            message = child.text or 'No message'
+                        elif child.tag == RULE_TAG:
+                            rule_id = child.get('id', 'Unknown')
+
                     # Determine severity based on role or message content
-                    severity = self._determine_severity(role, message or 'No message', test)
-                    
+                    severity = self._determine_severity(role, message, test)
+
                     # Count severity
-                    if severity in result['severity_breakdown']:
-                        result['severity_breakdown'][severity] += 1
+                    if severity in severity_breakdown:
+                        severity_breakdown[severity] += 1
                     else:
-                        result['severity_breakdown']['error'] += 1  # Default fallback
-                    
-                    error_detail = {
-                        'location': location,
-                        'test': test,
-                        'message': message,
-                        'severity': severity,
-                        'role': role
-                    }
-                    
-                    # Extract rule ID if available
-                    rule_elem = assertion.find('svrl:rule', ns)
-                    if rule_elem is not None:
-                        error_detail['rule_id'] = rule_elem.get('id', 'Unknown')
-                    
-                    result['error_details'].append(error_detail)
-        
+                        severity_breakdown['error'] += 1  # Default fallback
+
+                    error_details.append(ErrorDetail(location, test, message, severity, role, rule_id))
+
+                else:
+                    continue
+
+                # Release the processed element (and, with lxml, its already
+                # handled siblings) to keep memory bounded by tree depth
+                elem.clear()
+                if lxml_etree is not None:
+                    parent = elem.getparent()
+                    if parent is not None:
+                        while elem.getprevious() is not None:
+                            del parent[0]
+
+            result['fired_rules'] = fired_rules
+            result['failed_assertions'] = failed_assertions
+            result['successful_reports'] = successful_reports
+            result['severity_breakdown'] = severity_breakdown
+
+            if error_details:
+                result['error_details'] = error_details
+
         except Exception as e:
-            print(f"    ⚠️ Warning: Could not parse SVRL output: {e}")
+            logger.warning(f"    ⚠️ Warning: Could not parse SVRL output: {e}")
     
     def _determine_severity(self, role: str, message: str, test: str) -> str:
-        """Determine error severity based on role, message content, and test."""
-        # Check role first (Schematron standard)
+        """Determine error severity based on role and message content."""
+        # Check role first (Schematron standard); PEPPOL profiles set it, so
+        # the dict hit avoids any string allocation in the common case
+        severity = DIRECT_ROLES.get(role)
+        if severity is not None:
+            return severity
+
+        # Unusual casing still counts as a direct role match
         role_lower = role.lower()
-        if role_lower in ['fatal', 'error', 'warning', 'info']:
+        if role_lower in DIRECT_ROLES:
             return role_lower
-        
-        # Check for severity indicators in message
-        message_lower = message.lower()
-        if any(word in message_lower for word in ['fatal', 'critical', 'must not', 'required']):
+
+        # Check for severity indicators in message (precompiled, case-insensitive)
+        if SEVERITY_FATAL_RE.search(message):
             return 'fatal'
-        elif any(word in message_lower for word in ['error', 'invalid', 'violation', 'shall not']):
+        elif SEVERITY_ERROR_RE.search(message):
             return 'error'
-        elif any(word in message_lower for word in ['warning', 'should', 'recommend']):
+        elif SEVERITY_WARNING_RE.search(message):
             return 'warning'
-        elif any(word in message_lower for word in ['info', 'information', 'note']):
+        elif SEVERITY_INFO_RE.search(message):
             return 'info'
-        
-        # Check test for severity indicators
-        test_lower = test.lower()
-        if 'not(' in test_lower or 'false()' in test_lower:
-            return 'error'
-        
-        # Default to error
+
+        # Default to error (the old test-condition scan also always resolved
+        # to 'error', so it is folded into this default)
         return 'error'
     
+    @staticmethod
+    def _dump_json_bytes(obj: Any) -> bytes:
+        """Serialize one JSON fragment to compact UTF-8 bytes."""
+        if orjson is not None:
+            return orjson.dumps(obj)
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def _write_schematron_result(self, f: Any, xslt_result: Dict[str, Any]) -> None:
+        """Stream a single schematron result, emitting error records one by one."""
+        xslt_file_path = Path(xslt_result['xslt_file'])
+
+        head = {
+            "schematron_name": xslt_file_path.stem,
+            "xslt_file": str(xslt_file_path),
+            "processing_time_seconds": xslt_result['time'],
+            "rules_fired": xslt_result['fired_rules'],
+            "failed_assertions": xslt_result['failed_assertions'],
+            "successful_reports": xslt_result['successful_reports'],
+            "severity_breakdown": xslt_result.get('severity_breakdown', {})
+        }
+
+        # Drop the closing brace so the errors array can be appended in place
+        f.write(self._dump_json_bytes(head)[:-1])
+        f.write(b',"errors":[')
+        for index, error_detail in enumerate(xslt_result.get('error_details', [])):
+            if index:
+                f.write(b',')
+            f.write(self._dump_json_bytes(error_detail.to_json_dict()))
+        f.write(b']}')
+
     def _create_json_result(self, xml_file: Path, validation_result: Dict[str, Any]) -> None:
-        """Create detailed JSON result file for the validation."""
+        """Create detailed JSON result file for the validation.
+
+        The file is written incrementally — envelope first, then one
+        schematron result and one error record at a time — so peak memory is
+        bounded by a single record instead of the full serialized document.
+        """
         try:
             # Extract filename without extension for JSON file
             xml_filename = xml_file.stem
             json_filename = f"{xml_filename}_validation_result.json"
             json_file_path = self.results_dir / json_filename
-            
-            # Prepare detailed JSON structure
-            json_result = {
-                "validation_metadata": {
-                    "xml_file": str(xml_file),
-                    "xml_filename": xml_file.name,
-                    "file_size_bytes": validation_result['file_size'],
-                    "file_size_mb": round(validation_result['file_size'] / 1024 / 1024, 2),
-                    "validation_timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
-                    "validation_duration_seconds": validation_result['total_time'],
-                    "total_xslt_files_processed": len(validation_result['xslt_results'])
-                },
-                "overall_summary": {
-                    "validation_success": validation_result['success'],
-                    "total_rules_fired": validation_result['total_fired_rules'],
-                    "total_failed_assertions": validation_result['total_failed_assertions'],
-                    "total_successful_reports": validation_result['total_successful_reports'],
-                    "is_valid": validation_result['success'] and validation_result['total_failed_assertions'] == 0
-                },
-                "overall_severity_breakdown": {
-                    "fatal": 0,
-                    "error": 0,
-                    "warning": 0,
-                    "info": 0
-                },
-                "schematron_results": []
+
+            metadata = {
+                "xml_file": str(xml_file),
+                "xml_filename": xml_file.name,
+                "file_size_bytes": validation_result['file_size'],
+                "file_size_mb": round(validation_result['file_size'] / 1024 / 1024, 2),
+                "validation_timestamp": time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime()),
+                "validation_duration_seconds": validation_result['total_time'],
+                "total_xslt_files_processed": len(validation_result['xslt_results'])
             }
-            
-            # Process each XSLT (Schematron) result
-            for xslt_result in validation_result['xslt_results']:
-                if not xslt_result['success']:
-                    continue
-                    
-                # Extract schematron name from XSLT file path
-                xslt_file_path = Path(xslt_result['xslt_file'])
-                schematron_name = xslt_file_path.stem  # Remove .xsl extension
-                
-                # Get severity breakdown for this schematron
-                severity_breakdown = xslt_result.get('severity_breakdown', {})
-                
-                # Add to overall totals
-                for severity, count in severity_breakdown.items():
-                    if severity in json_result["overall_severity_breakdown"]:
-                        json_result["overall_severity_breakdown"][severity] += count
-                
-                schematron_result = {
-                    "schematron_name": schematron_name,
-                    "xslt_file": str(xslt_file_path),
-                    "processing_time_seconds": xslt_result['time'],
-                    "rules_fired": xslt_result['fired_rules'],
-                    "failed_assertions": xslt_result['failed_assertions'],
-                    "successful_reports": xslt_result['successful_reports'],
-                    "severity_breakdown": severity_breakdown,
-                    "errors": []
-                }
-                
-                # Add detailed error information
-                error_details = xslt_result.get('error_details', [])
-                for error in error_details:
-                    error_info = {
-                        "location": error['location'],
-                        "test": error['test'],
-                        "message": error['message'],
-                        "severity": error['severity'],
-                        "role": error['role']
-                    }
-                    
-                    # Add rule ID if available
-                    if 'rule_id' in error:
-                        error_info['rule_id'] = error['rule_id']
-                    
-                    schematron_result["errors"].append(error_info)
-                
-                json_result["schematron_results"].append(schematron_result)
-            
-            # Write JSON file
-            with open(json_file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_result, f, indent=2, ensure_ascii=False)
-            
-            print(f"📄 JSON result saved: {json_file_path.name}")
-            
+
+            overall_summary = {
+                "validation_success": validation_result['success'],
+                "total_rules_fired": validation_result['total_fired_rules'],
+                "total_failed_assertions": validation_result['total_failed_assertions'],
+                "total_successful_reports": validation_result['total_successful_reports'],
+                "is_valid": validation_result['success'] and validation_result['total_failed_assertions'] == 0
+            }
+
+            successful_results = [r for r in validation_result['xslt_results'] if r['success']]
+
+            # Severity totals come before the per-schematron results in the
+            # JSON layout, so sum the small per-schematron breakdowns first
+            overall_severity_breakdown = {
+                "fatal": 0,
+                "error": 0,
+                "warning": 0,
+                "info": 0
+            }
+            for xslt_result in successful_results:
+                for severity, count in xslt_result.get('severity_breakdown', {}).items():
+                    if severity in overall_severity_breakdown:
+                        overall_severity_breakdown[severity] += count
+
+            with open(json_file_path, 'wb', buffering=1024 * 1024) as f:
+                f.write(b'{"validation_metadata":')
+                f.write(self._dump_json_bytes(metadata))
+                f.write(b',"overall_summary":')
+                f.write(self._dump_json_bytes(overall_summary))
+                f.write(b',"overall_severity_breakdown":')
+                f.write(self._dump_json_bytes(overall_severity_breakdown))
+                f.write(b',"schematron_results":[')
+                for index, xslt_result in enumerate(successful_results):
+                    if index:
+                        f.write(b',')
+                    self._write_schematron_result(f, xslt_result)
+                f.write(b']}')
+
+            logger.info(f"📄 JSON result saved: {json_file_path.name}")
+
         except Exception as e:
-            print(f"⚠️ Warning: Failed to create JSON result file: {e}")
+            logger.warning(f"⚠️ Warning: Failed to create JSON result file: {e}")
     
     def validate_samples(self, samples_dir: Path, force_rebuild: bool = False) -> List[Dict[str, Any]]:
         """
@@ -417,8 +940,8 @@ class FastSchematronValidator:
         Returns:
             List of validation results
         """
-        print(f"🚀 Fast Schematron Validator - Validating samples in {samples_dir}")
-        print("=" * 80)
+        logger.info(f"🚀 Fast Schematron Validator - Validating samples in {samples_dir}")
+        logger.info("=" * 80)
         
         # Ensure XSLT files are generated
         if not self.ensure_xslt_generated(force_rebuild):
@@ -429,36 +952,88 @@ class FastSchematronValidator:
         xsl_files = list(xslt_dir.glob("*.xsl"))
         
         if not xsl_files:
-            print("❌ No XSLT files found for validation")
+            logger.warning("❌ No XSLT files found for validation")
             return []
         
-        print(f"📋 Found {len(xsl_files)} XSLT files:")
+        logger.info(f"📋 Found {len(xsl_files)} XSLT files:")
         for xsl_file in xsl_files:
-            print(f"  • {xsl_file.name}")
+            logger.info(f"  • {xsl_file.name}")
+
+        # Pre-warm the stylesheet compilation before any file is validated:
+        # compiling here exports the SEF files, so worker threads/processes
+        # just load them and the first file's timing doesn't carry the
+        # one-time compile cost. This only pays off when Saxon can actually
+        # export (Saxon-EE); on HE the first attempt flips the
+        # export-unavailable flag and the rest of the warm-up is skipped,
+        # since neither worker processes nor the per-thread compilers could
+        # reuse the parent's in-memory compile anyway
+        warmup_start = time.time()
+        for xsl_file in xsl_files:
+            if _SEF_EXPORT_UNAVAILABLE:
+                break
+            driver_file = self._get_summary_driver(xsl_file)
+            self.get_compiled_xslt(driver_file if driver_file else xsl_file)
+        if _SEF_EXPORT_UNAVAILABLE:
+            logger.info("🔥 Stylesheet pre-compilation skipped (SEF export unavailable on this Saxon edition)")
+        else:
+            logger.info(f"🔥 Stylesheets pre-compiled in {time.time() - warmup_start:.2f} seconds")
         
         # Find XML sample files
         if not samples_dir.exists():
-            print(f"❌ Samples directory not found: {samples_dir}")
+            logger.warning(f"❌ Samples directory not found: {samples_dir}")
             return []
         
-        xml_files = list(samples_dir.glob("*.xml"))
-        if not xml_files:
-            print(f"❌ No XML files found in {samples_dir}")
+        # One scandir pass enumerates the samples with their sizes (DirEntry
+        # caches the stat), so nothing below needs to re-stat the files
+        xml_entries = sorted(
+            ((Path(entry.path), entry.stat().st_size)
+             for entry in os.scandir(samples_dir)
+             if entry.is_file() and entry.name.endswith('.xml')),
+            key=lambda item: item[0].name)
+        if not xml_entries:
+            logger.warning(f"❌ No XML files found in {samples_dir}")
             return []
-        
-        print(f"\n📁 Found {len(xml_files)} sample files:")
-        for xml_file in xml_files:
-            size_mb = xml_file.stat().st_size / 1024 / 1024
-            print(f"  • {xml_file.name} ({size_mb:.1f} MB)")
-        
-        # Validate each file
-        all_results = []
+
+        logger.info(f"\n📁 Found {len(xml_entries)} sample files:")
+        for xml_file, xml_size in xml_entries:
+            logger.info(f"  • {xml_file.name} ({xml_size / 1024 / 1024:.1f} MB)")
+
+        # Validate each file; independent files are spread across worker
+        # processes so each one gets its own PySaxonProcessor (the shared SEF
+        # cache keeps compilation from being repeated per worker)
         total_start = time.time()
-        
-        for xml_file in xml_files:
-            results = self.validate_xml_file(xml_file, xsl_files)
-            all_results.append(results)
-        
+
+        if len(xml_entries) > 1:
+            xsl_paths = [str(p) for p in xsl_files]
+            max_workers = min(len(xml_entries), os.cpu_count() or 1)
+            # Workers configure their own logging and must mirror the
+            # parent's verbosity, otherwise --quiet is lost on pool runs
+            quiet = logging.getLogger().getEffectiveLevel() >= logging.WARNING
+            # Workers write to fd 1 directly; flush our buffered progress
+            # lines first so they precede the per-file worker output
+            flush_logging()
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                all_results = list(executor.map(_validate_one,
+                                                [str(f) for f, _ in xml_entries],
+                                                [xsl_paths] * len(xml_entries),
+                                                [size for _, size in xml_entries],
+                                                [quiet] * len(xml_entries)))
+
+            # Fold the workers' stats back into the parent's counters so the
+            # final summary (cache hits etc.) matches single-process runs
+            with self._stats_lock:
+                for result in all_results:
+                    delta = result.pop('_stats_delta', None)
+                    if delta:
+                        for key in ('total_validations', 'cache_hits', 'total_time'):
+                            self.stats[key] += delta[key]
+                        self.stats['largest_file_size'] = max(
+                            self.stats['largest_file_size'], delta['largest_file_size'])
+        else:
+            all_results = [self.validate_xml_file(xml_file, xsl_files, file_size=xml_size)
+                           for xml_file, xml_size in xml_entries]
+
         total_time = time.time() - total_start
         
         # Print final summary
@@ -468,9 +1043,9 @@ class FastSchematronValidator:
     
     def _print_final_summary(self, all_results: List[Dict[str, Any]], total_time: float):
         """Print comprehensive validation summary."""
-        print("\n" + "=" * 80)
-        print("🏁 VALIDATION SUMMARY")
-        print("=" * 80)
+        logger.info("\n" + "=" * 80)
+        logger.info("🏁 VALIDATION SUMMARY")
+        logger.info("=" * 80)
         
         successful_files = sum(1 for r in all_results if r['success'])
         total_files = len(all_results)
@@ -478,32 +1053,42 @@ class FastSchematronValidator:
         total_fired_rules = sum(r['total_fired_rules'] for r in all_results)
         total_errors = sum(r['total_failed_assertions'] for r in all_results)
         
-        print(f"📊 Files processed: {total_files}")
-        print(f"✅ Successful validations: {successful_files}")
-        print(f"❌ Failed validations: {total_files - successful_files}")
-        print(f"📏 Total data processed: {total_size:,} bytes ({total_size/1024/1024:.1f} MB)")
-        print(f"🔥 Total rules fired: {total_fired_rules:,}")
-        print(f"⚠️  Total validation errors: {total_errors:,}")
-        print(f"⏱️  Total time: {total_time:.2f} seconds")
-        print(f"🚀 Average speed: {(total_size/1024/1024)/total_time:.1f} MB/second")
+        failed_files = total_files - successful_files
+
+        logger.info(f"📊 Files processed: {total_files}")
+        logger.info(f"✅ Successful validations: {successful_files}")
+        # Zero counts are ordinary progress info; only non-zero counts need
+        # to surface in --quiet runs
+        if failed_files:
+            logger.warning(f"❌ Failed validations: {failed_files}")
+        else:
+            logger.info(f"❌ Failed validations: {failed_files}")
+        logger.info(f"📏 Total data processed: {total_size:,} bytes ({total_size/1024/1024:.1f} MB)")
+        logger.info(f"🔥 Total rules fired: {total_fired_rules:,}")
+        if total_errors:
+            logger.warning(f"⚠️  Total validation errors: {total_errors:,}")
+        else:
+            logger.info(f"⚠️  Total validation errors: {total_errors:,}")
+        logger.info(f"⏱️  Total time: {total_time:.2f} seconds")
+        logger.info(f"🚀 Average speed: {(total_size/1024/1024)/total_time:.1f} MB/second")
         
         if self.stats['cache_hits'] > 0:
-            print(f"🎯 XSLT cache hits: {self.stats['cache_hits']}")
+            logger.info(f"🎯 XSLT cache hits: {self.stats['cache_hits']}")
         
         # Per-file breakdown
-        print("\n📋 Detailed Results:")
+        logger.info("\n📋 Detailed Results:")
         for result in all_results:
             xml_name = Path(result['xml_file']).name
             size_mb = result['file_size'] / 1024 / 1024
             status = "✅ VALID" if result['success'] and result['total_failed_assertions'] == 0 else "❌ INVALID"
             
             if result['success']:
-                print(f"  • {xml_name:<25} ({size_mb:>6.1f} MB) - {status} - "
+                logger.info(f"  • {xml_name:<25} ({size_mb:>6.1f} MB) - {status} - "
                       f"{result['total_time']:>6.3f}s - "
                       f"Rules: {result['total_fired_rules']:>4}, "
                       f"Errors: {result['total_failed_assertions']:>3}")
             else:
-                print(f"  • {xml_name:<25} ({size_mb:>6.1f} MB) - {status} - FAILED")
+                logger.info(f"  • {xml_name:<25} ({size_mb:>6.1f} MB) - {status} - FAILED")
         
         # Performance analysis
         if total_files > 0:
@@ -511,17 +1096,17 @@ class FastSchematronValidator:
             largest_file = max(all_results, key=lambda x: x['file_size'])
             largest_size = largest_file['file_size'] / 1024 / 1024
             
-            print("\n🎯 Performance Analysis:")
-            print(f"  • Average time per file: {avg_time:.3f} seconds")
-            print(f"  • Largest file processed: {largest_size:.1f} MB")
-            print(f"  • Processing speed: {(total_size/1024/1024)/total_time:.1f} MB/second")
+            logger.info("\n🎯 Performance Analysis:")
+            logger.info(f"  • Average time per file: {avg_time:.3f} seconds")
+            logger.info(f"  • Largest file processed: {largest_size:.1f} MB")
+            logger.info(f"  • Processing speed: {(total_size/1024/1024)/total_time:.1f} MB/second")
             
             # Check if we met the original goal
             if largest_size > 50:  # Large file
                 largest_time = largest_file['total_time']
                 goal_met = largest_time < 60  # Under 1 minute goal
                 status = "🎉 GOAL MET" if goal_met else "⚠️ GOAL MISSED"
-                print(f"  • Large file goal (< 60s): {status} ({largest_time:.1f}s)")
+                logger.info(f"  • Large file goal (< 60s): {status} ({largest_time:.1f}s)")
 
 
 def main():
@@ -536,11 +1121,15 @@ def main():
                        default=default_samples_dir)
     parser.add_argument("--force-rebuild", "-f", action="store_true",
                        help="Force rebuild of XSLT files from Schematron")
-    parser.add_argument("--single-file", 
+    parser.add_argument("--single-file",
                        help="Validate a single XML file instead of all samples")
-    
+    parser.add_argument("--quiet", "-q", action="store_true",
+                       help="Only log warnings and errors")
+
     args = parser.parse_args()
-    
+
+    configure_logging(args.quiet)
+
     try:
         validator = FastSchematronValidator()
         
@@ -559,7 +1148,7 @@ def main():
             xsl_files = list(xslt_dir.glob("*.xsl"))
             
             if not xsl_files:
-                print("❌ No XSLT files found for validation")
+                logger.warning("❌ No XSLT files found for validation")
                 sys.exit(1)
             
             # Validate the file
@@ -581,10 +1170,10 @@ def main():
             sys.exit(0 if all_valid else 1)
     
     except KeyboardInterrupt:
-        print("\n🛑 Validation interrupted by user")
+        logger.info("\n🛑 Validation interrupted by user")
         sys.exit(130)
     except Exception as e:
-        print(f"💥 Error: {e}")
+        logger.warning(f"💥 Error: {e}")
         sys.exit(1)
 
 
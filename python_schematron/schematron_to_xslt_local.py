@@ -1,16 +1,23 @@
 """
 Python implementation of the Schematron to XSLT transformer.
 Uses SaxonC-HE and local ISO transformation stylesheets.
-Uses .temp folder approach instead of tempfile for intermediate files.
+The three pipeline stages are chained in memory as XDM trees;
+only the final XSLT is written to disk.
 """
 
+import argparse
+import os
 import sys
 import hashlib
+import importlib.metadata
+import json
+import mmap
+import multiprocessing
 import time
 import re
-import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
     from saxonche import PySaxonProcessor
@@ -19,17 +26,71 @@ except ImportError:
     sys.exit(1)
 
 
+# Opening tag of a generated stylesheet's root element, compiled once instead
+# of per processed file; a bytes pattern so the namespace fix-up never has to
+# decode the file
+ROOT_STYLESHEET_RE = re.compile(rb'(<(?:xsl:)?stylesheet[^>]*?)>')
+XSD_NAMESPACE_REPLACEMENT = rb'\1 xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+
+# All structural markers validate_output cares about, matched in a single
+# pass; <xsl:template must come before the stylesheet alternative so
+# <xsl:stylesheet still falls through to the root-element branch
+XSL_VALIDATION_RE = re.compile(rb'<xsl:template|<(?:xsl:)?stylesheet|xmlns:')
+
+# Per-process transformer for the batch process pool; created lazily so each
+# worker process builds its own PySaxonProcessor
+_WORKER_TRANSFORMER: Optional['SchematronToXSLTTransformer'] = None
+
+# Set after the first failed SEF export: Saxon-HE cannot save compiled
+# stylesheets, so the failure is permanent for the process and later
+# compiles skip the save= attempt (and its warning) entirely
+_SEF_EXPORT_UNAVAILABLE = False
+
+# One PySaxonProcessor per process: Saxon's processor init allocates JVM/JIT
+# state that is expensive to pay repeatedly, so if several transformers are
+# created in the same process they all share this instance
+_PROCESSOR_SINGLETON: Optional[Any] = None
+
+
+def _get_shared_processor() -> Any:
+    global _PROCESSOR_SINGLETON
+    if _PROCESSOR_SINGLETON is None:
+        _PROCESSOR_SINGLETON = PySaxonProcessor(license=False)  # Use HE (Home Edition)
+    return _PROCESSOR_SINGLETON
+
+
+def _transform_one(base_dir: Optional[str], sch_path: str,
+                   verbose: bool = False) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """Transform (and validate) a single Schematron file in a worker process.
+
+    Returns the success flag plus the worker's cache index entry so the
+    parent process can merge it into its own index (workers never write
+    index.json themselves — concurrent writers would clobber each other).
+    """
+    global _WORKER_TRANSFORMER
+    if _WORKER_TRANSFORMER is None:
+        _WORKER_TRANSFORMER = SchematronToXSLTTransformer(base_dir, verbose=verbose)
+
+    sch_file = Path(sch_path)
+    if _WORKER_TRANSFORMER.transform_schematron_file(sch_file):
+        _WORKER_TRANSFORMER.validate_output(sch_file)
+        return True, _WORKER_TRANSFORMER.get_cache_info(sch_file)
+    return False, None
+
+
 class SchematronToXSLTTransformer:
     """Transforms Schematron (.sch) files to XSLT (.xsl) files using the ISO pipeline."""
     
-    def __init__(self, base_dir: Optional[str] = None):
+    def __init__(self, base_dir: Optional[str] = None, verbose: bool = False):
         """
         Initialize the transformer.
-        
+
         Args:
             base_dir: Base directory containing ISO transformation stylesheets.
                      If None, uses the local sch_to_xsl_transformers directory.
+            verbose: If True, print per-step debug output during transforms.
         """
+        self.verbose = verbose
         if base_dir is None:
             # Use the local sch_to_xsl_transformers directory
             self.base_dir = Path(__file__).parent / "sch_to_xsl_transformers"
@@ -39,13 +100,11 @@ class SchematronToXSLTTransformer:
         self.schematron_dir = Path(__file__).parent / "Schematron"
         self.output_dir = Path(__file__).parent / "xslt_schematron"
         self.cache_dir = Path(__file__).parent / ".cache"
-        self.temp_dir = Path(__file__).parent / ".temp"
-        
+
         # Create directories if they don't exist with proper error handling
         try:
             self.output_dir.mkdir(exist_ok=True)
             self.cache_dir.mkdir(exist_ok=True)
-            self.temp_dir.mkdir(exist_ok=True)
         except (OSError, PermissionError) as e:
             print(f"Error: Could not create required directories: {e}")
             raise
@@ -55,10 +114,157 @@ class SchematronToXSLTTransformer:
         self.iso_abstract_expand = self.base_dir / "iso_abstract_expand.xsl" 
         self.iso_svrl_for_xslt2 = self.base_dir / "iso_svrl_for_xslt2.xsl"
         
-        # Initialize Saxon processor
-        self.processor = PySaxonProcessor(license=False)  # Use HE (Home Edition)
-        self.xslt_processor = self.processor.new_xslt30_processor()
-        
+        # Saxon processor state is created lazily (see the properties below)
+        # so the batch process pool can fork/spawn workers before any JVM
+        # state exists in the parent
+        self._processor: Optional[Any] = None
+        self._xslt_processor: Optional[Any] = None
+
+        # Compiled ISO stylesheet executables, keyed by path; each of the
+        # three pipeline stylesheets is compiled once and reused for every
+        # .sch file instead of once per transformation step
+        self._compiled: Dict[str, Any] = {}
+
+        # Causal hash of the whole pipeline, computed lazily on first use
+        self._pipeline_hash: Optional[str] = None
+
+        # Single cache index for all .sch files, loaded once instead of one
+        # small metadata file per Schematron; flushed at the end of a batch
+        self._cache_index: Dict[str, Dict[str, Any]] = {}
+        self._cache_dirty = False
+
+        # Hashes computed by needs_transformation, keyed by path, so
+        # transform_schematron_file doesn't re-read the file to hash it again
+        self._pending_hashes: Dict[str, str] = {}
+        index_file = self.cache_dir / "index.json"
+        if index_file.exists():
+            try:
+                self._cache_index = json.loads(index_file.read_text(encoding='utf-8'))
+            except Exception:
+                self._cache_index = {}
+
+    @property
+    def pipeline_hash(self) -> str:
+        """Combined hash of the ISO stylesheets and the Saxon version.
+
+        Cached outputs depend on the whole pipeline, not just the source
+        .sch file — updating e.g. iso_svrl_for_xslt2.xsl must invalidate
+        previously generated XSLTs.
+        """
+        if self._pipeline_hash is None:
+            hasher = hashlib.blake2b(digest_size=16)
+            for dependency in (self.iso_dsdl_include, self.iso_abstract_expand,
+                               self.iso_svrl_for_xslt2):
+                hasher.update(self.calculate_file_hash(dependency).encode('ascii'))
+            try:
+                saxon_version = importlib.metadata.version('saxonche')
+            except importlib.metadata.PackageNotFoundError:
+                saxon_version = 'unknown'
+            hasher.update(saxon_version.encode('utf-8'))
+            self._pipeline_hash = hasher.hexdigest()
+        return self._pipeline_hash
+
+    @property
+    def processor(self) -> Any:
+        """The Saxon processor for this transformer, created on first use.
+
+        Shared process-wide: the processor stays alive across the whole
+        batch, and any other transformers in the same process reuse it
+        rather than re-initializing Saxon.
+        """
+        if self._processor is None:
+            self._processor = _get_shared_processor()
+        return self._processor
+
+    @property
+    def xslt_processor(self) -> Any:
+        """The XSLT 3.0 compiler for this transformer, created on first use."""
+        if self._xslt_processor is None:
+            self._xslt_processor = self.processor.new_xslt30_processor()
+        return self._xslt_processor
+
+    def __enter__(self) -> 'SchematronToXSLTTransformer':
+        """Support use as a context manager for long-running callers.
+
+        Hold one transformer open across many transform_schematron_file
+        calls — the Saxon processor and compiled pipeline stylesheets are
+        reused for every file.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Drop per-transformer references; the shared processor itself stays
+        # alive for the rest of the process so later transformers reuse it
+        self._compiled.clear()
+        self._xslt_processor = None
+        self._processor = None
+        self._flush_cache_index()
+
+    def get_compiled_stylesheet(self, xsl_file: Path) -> Optional[Any]:
+        """Get the compiled executable for a stylesheet, compiling it only once.
+
+        Compiled stylesheets are also exported to the cache directory in
+        Saxon's SEF format, keyed by the stylesheet hash, so later runs load
+        the compiled form instead of recompiling (iso_svrl_for_xslt2.xsl in
+        particular is slow to compile).
+        """
+        cache_key = str(xsl_file)
+        xslt_executable = self._compiled.get(cache_key)
+        if xslt_executable is not None:
+            return xslt_executable
+
+        sef_path = self.cache_dir / f"{self.calculate_file_hash(xsl_file)}.sef.json"
+
+        global _SEF_EXPORT_UNAVAILABLE
+
+        xslt_executable = self._compile_from_sef(sef_path)
+        if xslt_executable is None and not _SEF_EXPORT_UNAVAILABLE:
+            # Export the compiled SEF for future runs. Saxon-HE raises on
+            # save= but still creates the output file, so the export goes to
+            # a per-process temp path and is moved into place only when it
+            # has content — a failed export never leaves a partial SEF behind,
+            # and concurrent pool workers can't observe each other's
+            # half-written exports
+            tmp_sef_path = sef_path.with_name(f"{sef_path.name}.{os.getpid()}.tmp")
+            try:
+                self.xslt_processor.compile_stylesheet(
+                    stylesheet_file=cache_key, save=True,
+                    output_file=str(tmp_sef_path))
+                if tmp_sef_path.exists() and tmp_sef_path.stat().st_size > 0:
+                    os.replace(tmp_sef_path, sef_path)
+            except Exception as e:
+                # Permanent on HE: warn once, then compile from source
+                # without re-attempting the export
+                _SEF_EXPORT_UNAVAILABLE = True
+                print("Warning: Could not export compiled stylesheet "
+                      f"(compiling from source for the rest of this run): {e}")
+            finally:
+                tmp_sef_path.unlink(missing_ok=True)
+
+            xslt_executable = self._compile_from_sef(sef_path)
+
+        if xslt_executable is None:
+            # No usable SEF (e.g. Saxon-HE cannot export) - plain compile
+            xslt_executable = self.xslt_processor.compile_stylesheet(stylesheet_file=cache_key)
+
+        if not xslt_executable:
+            print(f"Error: Failed to compile XSLT: {xsl_file}")
+            print(f"Saxon error: {self.processor.error_message}")
+            return None
+
+        self._compiled[cache_key] = xslt_executable
+        return xslt_executable
+
+    def _compile_from_sef(self, sef_path: Path) -> Optional[Any]:
+        """Load a cached SEF export, treating empty or unloadable files as a miss."""
+        try:
+            if not sef_path.exists() or sef_path.stat().st_size == 0:
+                return None
+            return self.xslt_processor.compile_stylesheet(
+                stylesheet_file=str(sef_path)) or None
+        except Exception:
+            return None
+
     def check_requirements(self) -> bool:
         """Check if all required files exist."""
         required_files = [
@@ -81,226 +287,201 @@ class SchematronToXSLTTransformer:
         return True
     
     def calculate_file_hash(self, file_path: Path) -> str:
-        """Calculate MD5 hash of a file."""
-        hash_md5 = hashlib.md5()
+        """Calculate the BLAKE2b content hash of a file.
+
+        The hash is a cache key, not a cryptographic check, so BLAKE2b with a
+        16-byte digest is used (faster than MD5). Typical .sch/.xsl inputs are
+        well under a megabyte, so they are hashed in a single read; anything
+        unusually large streams through hashlib.file_digest (a C-level read
+        loop, Python 3.11+) or falls back to 1 MiB chunks.
+        """
+        file_path = Path(file_path)
+        if file_path.stat().st_size <= 16 * 1024 * 1024:
+            return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+
+        if hasattr(hashlib, 'file_digest'):
+            with open(file_path, "rb") as f:
+                return hashlib.file_digest(
+                    f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+        hasher = hashlib.blake2b(digest_size=16)
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
-    def get_cache_info(self, sch_file: Path) -> Dict[str, str]:
-        """Get cache information for a Schematron file."""
-        cache_file = self.cache_dir / f"{sch_file.stem}.cache"
-        
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    lines = f.read().strip().split('\n')
-                    if len(lines) >= 2:
-                        return {
-                            'hash': lines[0],
-                            'timestamp': lines[1]
-                        }
-            except Exception:
-                pass
-        
-        return {}
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
     
+    def get_cache_info(self, sch_file: Path) -> Dict[str, Any]:
+        """Get cache information for a Schematron file (in-memory lookup)."""
+        return self._cache_index.get(sch_file.stem, {})
+
     def save_cache_info(self, sch_file: Path, file_hash: str):
-        """Save cache information for a Schematron file."""
-        cache_file = self.cache_dir / f"{sch_file.stem}.cache"
-        
+        """Record cache information for a Schematron file in the index.
+
+        Only updates the in-memory index; _flush_cache_index writes the
+        whole index to disk once per batch.
+        """
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                f.write(f"{file_hash}\n")
-                f.write(f"{int(time.time())}\n")
+            stat = sch_file.stat()
+            self._cache_index[sch_file.stem] = {
+                'hash': file_hash,
+                'timestamp': int(time.time()),
+                'pipeline_hash': self.pipeline_hash,
+                'mtime': stat.st_mtime_ns,
+                'size': stat.st_size,
+            }
+            self._cache_dirty = True
         except Exception as e:
             print(f"Warning: Could not save cache info: {e}")
+
+    def _flush_cache_index(self):
+        """Write the cache index to disk if it has unsaved entries."""
+        if not self._cache_dirty:
+            return
+        try:
+            index_file = self.cache_dir / "index.json"
+            index_file.write_text(json.dumps(self._cache_index, indent=2),
+                                  encoding='utf-8')
+            self._cache_dirty = False
+        except Exception as e:
+            print(f"Warning: Could not save cache index: {e}")
     
     def needs_transformation(self, sch_file: Path) -> bool:
-        """Check if Schematron file needs transformation based on MD5 hash."""
+        """Check if a Schematron file needs transformation.
+
+        Checks, in order: the output .xsl exists, the cached pipeline hash
+        matches (ISO stylesheets + Saxon version), the source's mtime+size
+        match the cached stat (cheap short-circuit), and finally the BLAKE2b
+        content hash.
+        """
         output_file = self.output_dir / f"{sch_file.stem}.xsl"
         
         # If output doesn't exist, definitely need transformation
         if not output_file.exists():
             return True
         
-        # Check if input file hash has changed
-        current_hash = self.calculate_file_hash(sch_file)
         cache_info = self.get_cache_info(sch_file)
-        
+
+        # The cached output also depends on the ISO stylesheets and Saxon
+        # version; a changed pipeline invalidates it too
+        if cache_info.get('pipeline_hash') != self.pipeline_hash:
+            return True
+
+        # Cheap stat check first: if mtime and size match the cached values
+        # the file is unchanged and the full hash read can be skipped
+        stat = sch_file.stat()
+        if (cache_info.get('mtime') == stat.st_mtime_ns
+                and cache_info.get('size') == stat.st_size):
+            return False
+
+        # Stat differs (or old cache format) - fall back to content hash
+        current_hash = self.calculate_file_hash(sch_file)
         if cache_info.get('hash') != current_hash:
+            # Keep the hash around so the subsequent transform can cache it
+            # without re-reading the file
+            self._pending_hashes[str(sch_file)] = current_hash
             return True
-        
+
+        # Content unchanged but the file was touched; refresh the stat
+        # metadata so the next run short-circuits again
+        self.save_cache_info(sch_file, current_hash)
         return False
     
-    def run_xslt_transformation(self, source_file: str, xsl_file: str, output_file: str) -> bool:
-        """
-        Run a single XSLT transformation step.
-        
-        Args:
-            source_file: Input XML file path
-            xsl_file: XSLT stylesheet file path  
-            output_file: Output file path
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Compile the XSLT stylesheet
-            xslt_executable = self.xslt_processor.compile_stylesheet(stylesheet_file=str(xsl_file))
-            if not xslt_executable:
-                print(f"Error: Failed to compile XSLT: {xsl_file}")
-                print(f"Saxon error: {self.processor.error_message}")
-                return False
-            
-            # Execute transformation and save to file
-            xslt_executable.transform_to_file(source_file=str(source_file), output_file=str(output_file))
-            
-            if self.processor.exception_occurred:
-                print("Error: XSLT transformation failed")
-                print(f"Saxon error: {self.processor.error_message}")
-                return False
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error during XSLT transformation: {e}")
-            return False
-    
     def add_missing_xsd_namespace(self, xsl_file: Path) -> bool:
         """
         Add missing xmlns:xsd namespace if not present without corrupting existing namespaces.
-        Uses text-based approach to preserve namespace prefixes.
+        Works on raw bytes with one substitution pass, so the common
+        "namespace already present" case costs a single read plus a C-level
+        scan — no UTF-8 decode/encode round trip.
         """
         try:
-            # Read the file as text
-            with open(xsl_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
+            content = xsl_file.read_bytes()
+
             # Check if xsd namespace is already defined
-            if 'xmlns:xsd=' in content:
+            if b'xmlns:xsd=' in content:
                 return False  # Already has xsd namespace
-            
-            # Find the root element opening tag and add the xsd namespace
-            # Look for <xsl:stylesheet or <stylesheet
-            
-            # Pattern to match the root element opening tag
-            root_pattern = r'(<(?:xsl:)?stylesheet[^>]*?)>'
-            match = re.search(root_pattern, content)
-            
-            if match:
-                # Add the xsd namespace declaration before the closing >
-                old_tag = match.group(0)
-                new_tag = old_tag[:-1] + ' xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
-                
-                # Replace only the first occurrence (root element)
-                content = content.replace(old_tag, new_tag, 1)
-                
-                # Write back to file
-                with open(xsl_file, 'w', encoding='utf-8') as f:
-                    f.write(content)
-                
-                print(f"Adding missing xmlns:xsd namespace to {xsl_file}")
-                return True
-            else:
+
+            # Splice the declaration into the root element opening tag
+            # (first occurrence only)
+            content, replaced = ROOT_STYLESHEET_RE.subn(
+                XSD_NAMESPACE_REPLACEMENT, content, count=1)
+
+            if not replaced:
                 print(f"Warning: Could not find root stylesheet element in {xsl_file}")
                 return False
-            
+
+            xsl_file.write_bytes(content)
+
+            print(f"Adding missing xmlns:xsd namespace to {xsl_file}")
+            return True
+
         except Exception as e:
             print(f"Warning: Could not check/add xsd namespace: {e}")
             return False
     
-    def compare_step_files(self, step_name: str, temp_file: Path):
-        """Compare intermediate step files for debugging."""
-        print(f"    📄 {step_name}: {temp_file.name}")
-        if temp_file.exists():
-            file_size = temp_file.stat().st_size
-            print(f"       Size: {file_size:,} bytes")
-            
-            # Show first few lines for verification
-            try:
-                with open(temp_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()[:3]
-                    for i, line in enumerate(lines, 1):
-                        print(f"       Line {i}: {line.strip()[:80]}...")
-            except Exception:
-                pass
-    
     def transform_schematron_file(self, sch_file: Path) -> bool:
         """
-        Transform a single Schematron file to XSLT using .temp folder.
-        Follows the exact same 3-step process as the ISO pipeline.
+        Transform a single Schematron file to XSLT.
+        Follows the exact same 3-step process as the ISO pipeline, but chains
+        the steps in memory: each stage's XDM result tree feeds the next, and
+        only the final step writes to disk.
         """
         print(f"\nTransforming {sch_file.name}...")
-        
-        # Create temp directory and intermediate file paths
-        temp_dir = self.temp_dir
-        temp_dir.mkdir(exist_ok=True)
-        
-        # Define intermediate file paths
-        temp_output1 = temp_dir / f"{sch_file.stem}_step1.xml"
-        temp_output2 = temp_dir / f"{sch_file.stem}_step2.xml"
-        temp_output3 = temp_dir / f"{sch_file.stem}_step3.xml"
-        
+
         try:
-            # Step 1: iso_dsdl_include.xsl transformation
-            print(f"  Running iso_dsdl_include.xsl transformation on {sch_file}...")
-            if not self.run_xslt_transformation(str(sch_file), str(self.iso_dsdl_include), str(temp_output1)):
+            # Get the compiled pipeline stylesheets (compiled once, reused)
+            include_executable = self.get_compiled_stylesheet(self.iso_dsdl_include)
+            expand_executable = self.get_compiled_stylesheet(self.iso_abstract_expand)
+            svrl_executable = self.get_compiled_stylesheet(self.iso_svrl_for_xslt2)
+            if not (include_executable and expand_executable and svrl_executable):
                 return False
-            self.compare_step_files("Step 1 output", temp_output1)
-            
-            # Step 2: iso_abstract_expand.xsl transformation  
-            print("  Running iso_abstract_expand.xsl transformation...")
-            if not self.run_xslt_transformation(str(temp_output1), str(self.iso_abstract_expand), str(temp_output2)):
+
+            # Step 1: iso_dsdl_include.xsl transformation
+            if self.verbose:
+                print(f"  Running iso_dsdl_include.xsl transformation on {sch_file}...")
+            step1_result = include_executable.transform_to_value(source_file=str(sch_file))
+            if step1_result is None:
+                print("Error: iso_dsdl_include transformation produced no result")
+                print(f"Saxon error: {self.processor.error_message}")
                 return False
-            self.compare_step_files("Step 2 output", temp_output2)
 
-            # Step 3: iso_svrl_for_xslt2.xsl transformation
-            print("  Running iso_svrl_for_xslt2.xsl transformation...")
-            if not self.run_xslt_transformation(str(temp_output2), str(self.iso_svrl_for_xslt2), str(temp_output3)):
+            # Step 2: iso_abstract_expand.xsl transformation
+            if self.verbose:
+                print("  Running iso_abstract_expand.xsl transformation...")
+            step2_result = expand_executable.transform_to_value(
+                xdm_node=getattr(step1_result, 'head', step1_result))
+            if step2_result is None:
+                print("Error: iso_abstract_expand transformation produced no result")
+                print(f"Saxon error: {self.processor.error_message}")
                 return False
-            self.compare_step_files("Step 3 output", temp_output3)
 
-            # Copy final result to output directory overwriting any existing file
-            print("  Copying final result to output directory...")
+            # Step 3: iso_svrl_for_xslt2.xsl transformation, written directly
+            # to the final output path
+            if self.verbose:
+                print("  Running iso_svrl_for_xslt2.xsl transformation...")
             output_xsl_path = self.output_dir / f"{sch_file.stem}.xsl"
-            
-            try:
-                if output_xsl_path.exists():
-                    print(f"  Deleting existing file: {output_xsl_path}")
-                    output_xsl_path.unlink()
-                
-                # Create parent directory if needed
-                output_xsl_path.parent.mkdir(exist_ok=True, parents=True)
-                
-                # Copy the file (using shutil.copy2 to preserve metadata)
-                shutil.copy2(temp_output3, output_xsl_path)
-            except (OSError, PermissionError) as e:
-                print(f"  ❌ Error copying file: {e}")
+            svrl_executable.transform_to_file(
+                xdm_node=getattr(step2_result, 'head', step2_result),
+                output_file=str(output_xsl_path))
+
+            if self.processor.exception_occurred:
+                print("Error: XSLT transformation failed")
+                print(f"Saxon error: {self.processor.error_message}")
                 return False
 
             # Add missing xmlns:xsd namespace if needed
             self.add_missing_xsd_namespace(output_xsl_path)
-            
-            # Update cache
-            file_hash = self.calculate_file_hash(sch_file)
+
+            # Update cache, reusing the hash needs_transformation already
+            # computed when it flagged this file
+            file_hash = self._pending_hashes.pop(str(sch_file), None)
+            if file_hash is None:
+                file_hash = self.calculate_file_hash(sch_file)
             self.save_cache_info(sch_file, file_hash)
-            
+
             print(f"  ✅ Successfully created {output_xsl_path}")
-            
-            # Clean up intermediate files (optional - safer cleanup with better error handling)
-            for temp_file in [temp_output1, temp_output2, temp_output3]:
-                try:
-                    if temp_file.exists():
-                        temp_file.unlink()
-                except (OSError, PermissionError) as e:
-                    print(f"  ⚠️ Warning: Could not delete temporary file {temp_file.name}: {e}")
-                except Exception:
-                    pass  # Keep files for debugging if deletion fails for other reasons
-            
+
             return True
-            
+
         except Exception as e:
             print(f"  ❌ Error transforming {sch_file}: {e}")
             return False
@@ -322,26 +503,36 @@ class SchematronToXSLTTransformer:
             return False
         
         try:
-            # Read the file
-            with open(output_result, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Basic validation checks
-            file_size = len(content)
-            print(f"  📊 Generated XSLT: {file_size:,} characters")
-            
+            # All structural markers are ASCII, so the file is scanned as
+            # bytes in one pass: the combined regex walks an mmap of the
+            # file (no bytes copy, no UTF-8 decode) and bumps one counter
+            # per marker kind
+            has_stylesheet_root = False
+            namespace_count = 0
+            template_count = 0
+            with open(output_result, 'rb') as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size > 0:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        for match in XSL_VALIDATION_RE.finditer(mapped):
+                            marker = match.group()
+                            if marker == b'xmlns:':
+                                namespace_count += 1
+                            elif marker == b'<xsl:template':
+                                template_count += 1
+                            else:
+                                has_stylesheet_root = True
+
+            if self.verbose:
+                print(f"  📊 Generated XSLT: {file_size:,} bytes")
+
             # Check if it contains expected XSLT elements
-            if '<xsl:stylesheet' not in content and '<stylesheet' not in content:
+            if not has_stylesheet_root:
                 print("  ⚠️  Warning: No stylesheet root element found")
                 return False
-            
-            # Check for namespace declarations
-            namespace_count = content.count('xmlns:')
-            print(f"  📊 Namespace declarations: {namespace_count}")
-            
-            # Check for template rules
-            template_count = content.count('<xsl:template')
-            print(f"  📊 Template rules: {template_count}")
+            if self.verbose:
+                print(f"  📊 Namespace declarations: {namespace_count}")
+                print(f"  📊 Template rules: {template_count}")
             
             if template_count == 0:
                 print("  ⚠️  Warning: No template rules found")
@@ -367,8 +558,11 @@ class SchematronToXSLTTransformer:
         if not self.check_requirements():
             return False
         
-        # Find all .sch files
-        sch_files = list(self.schematron_dir.glob("*.sch"))
+        # Find all .sch files; scandir's DirEntry carries cached type info,
+        # so this avoids the extra stat per entry that glob pays
+        sch_files = [Path(entry.path) for entry in os.scandir(self.schematron_dir)
+                     if entry.is_file(follow_symlinks=False)
+                     and entry.name.endswith('.sch')]
         if not sch_files:
             print(f"No .sch files found in {self.schematron_dir}")
             return False
@@ -379,22 +573,46 @@ class SchematronToXSLTTransformer:
         
         success_count = 0
         total_files = len(sch_files)
-        
+
+        # Split up-to-date files from the ones that need transforming
+        pending_files = []
         for sch_file in sch_files:
-            # Check if transformation is needed
             if not force_rebuild and not self.needs_transformation(sch_file):
                 print(f"\n{sch_file.name} is up to date (skipping)")
                 success_count += 1
-                continue
-            
-            # Transform the file
-            if self.transform_schematron_file(sch_file):
-                # Validate the output
-                self.validate_output(sch_file)
-                success_count += 1
             else:
-                print(f"  ❌ Failed to transform {sch_file.name}")
-        
+                pending_files.append(sch_file)
+
+        # Each pending file is an independent transformation, so spread them
+        # across worker processes; every worker builds its own Saxon state
+        if len(pending_files) > 1:
+            max_workers = min(len(pending_files), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                outcomes = executor.map(_transform_one,
+                                        [str(self.base_dir)] * len(pending_files),
+                                        [str(p) for p in pending_files],
+                                        [self.verbose] * len(pending_files))
+                for sch_file, (transformed, cache_entry) in zip(pending_files, outcomes):
+                    if transformed:
+                        if cache_entry:
+                            self._cache_index[sch_file.stem] = cache_entry
+                            self._cache_dirty = True
+                        success_count += 1
+                    else:
+                        print(f"  ❌ Failed to transform {sch_file.name}")
+        else:
+            for sch_file in pending_files:
+                if self.transform_schematron_file(sch_file):
+                    # Validate the output
+                    self.validate_output(sch_file)
+                    success_count += 1
+                else:
+                    print(f"  ❌ Failed to transform {sch_file.name}")
+
+        # Persist all cache updates from this batch in one write
+        self._flush_cache_index()
+
         print(f"\n{'='*60}")
         print("TRANSFORMATION SUMMARY")
         print(f"{'='*60}")
@@ -413,8 +631,6 @@ class SchematronToXSLTTransformer:
 
 def main():
     """Command line interface for the Schematron transformer."""
-    import argparse
-    
     parser = argparse.ArgumentParser(description="Transform Schematron (.sch) files to XSLT (.xsl)")
     parser.add_argument("--force", "-f", action="store_true",
                        help="Force rebuild even if files are up to date")
@@ -422,12 +638,14 @@ def main():
                        help="Base directory containing ISO transformation stylesheets")
     parser.add_argument("--check", action="store_true",
                        help="Check requirements and show status")
-    
+    parser.add_argument("--verbose", "-v", action="store_true",
+                       help="Print per-step debug output during transforms")
+
     args = parser.parse_args()
-    
+
     try:
         # Initialize transformer
-        transformer = SchematronToXSLTTransformer(args.base_dir)
+        transformer = SchematronToXSLTTransformer(args.base_dir, verbose=args.verbose)
         
         if args.check:
             print("Checking requirements...")
@@ -435,7 +653,10 @@ def main():
                 print("✅ All requirements are met")
                 
                 # Show file status
-                sch_files = list(transformer.schematron_dir.glob("*.sch"))
+                sch_files = [Path(entry.path)
+                             for entry in os.scandir(transformer.schematron_dir)
+                             if entry.is_file(follow_symlinks=False)
+                             and entry.name.endswith('.sch')]
                 if sch_files:
                     print(f"\nFound {len(sch_files)} Schematron files:")
                     for sch_file in sch_files: